@@ -1,9 +1,77 @@
+import atexit
+import queue
+import threading
+import time
+
 from app.db.models.video_tasks import VideoTask
 from app.db.engine import get_db
 from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# ---------- write-behind 插入 ----------
+# 任务热路径只往队列里丢一条记录，后台线程攒批后一次 commit，
+# SQLite 的 fsync 不再阻塞笔记生成线程
+
+_insert_queue: queue.Queue = queue.Queue()
+_insert_worker = None
+_insert_worker_lock = threading.Lock()
+
+
+def _insert_worker_loop():
+    while True:
+        batch = [_insert_queue.get()]
+        # 把队列里已有的记录一并捞出来，单次 commit 落多行
+        while True:
+            try:
+                batch.append(_insert_queue.get_nowait())
+            except queue.Empty:
+                break
+
+        # 拿会话也可能失败，任何异常都不能让 worker 线程死掉；
+        # task_done 放在最外层 finally，保证 flush 不会卡在已取出的批次上
+        try:
+            db = next(get_db())
+            try:
+                db.add_all([VideoTask(**fields) for fields in batch])
+                db.commit()
+                logger.info(f"Video task batch inserted: {len(batch)} task(s)")
+            finally:
+                db.close()
+        except Exception as e:
+            logger.error(f"Failed to insert video task batch: {e}")
+        finally:
+            for _ in batch:
+                _insert_queue.task_done()
+
+
+def _flush_pending_inserts(timeout: float = 5.0):
+    """进程退出前尽量把挂起的插入刷完；超时放弃，不把解释器关停卡死"""
+    deadline = time.monotonic() + timeout
+    with _insert_queue.all_tasks_done:
+        while _insert_queue.unfinished_tasks:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                logger.warning(
+                    f"Video task flush timed out, {_insert_queue.unfinished_tasks} insert(s) dropped"
+                )
+                break
+            _insert_queue.all_tasks_done.wait(remaining)
+
+
+def insert_video_task_async(video_id: str, platform: str, task_id: str):
+    """插入任务（write-behind：入队即返回，后台线程批量落库）"""
+    global _insert_worker
+    with _insert_worker_lock:
+        if _insert_worker is None:
+            _insert_worker = threading.Thread(
+                target=_insert_worker_loop, name="video-task-writer", daemon=True
+            )
+            _insert_worker.start()
+            # 进程退出前把挂起的插入刷完（带超时）
+            atexit.register(_flush_pending_inserts)
+    _insert_queue.put({"video_id": video_id, "platform": platform, "task_id": task_id})
+
 
 # 插入任务
 def insert_video_task(video_id: str, platform: str, task_id: str):
@@ -6,9 +6,9 @@ from pathlib import Path
 from typing import Optional
 from urllib.parse import urlparse
 
+import orjson
 from fastapi import APIRouter, HTTPException, BackgroundTasks, UploadFile, File
 from pydantic import BaseModel, validator, field_validator
-from dataclasses import asdict
 
 from app.db.video_task_dao import get_task_by_video
 from app.enmus.exception import NoteErrorEnum
@@ -69,8 +69,9 @@ UPLOAD_DIR = "uploads"
 
 def save_note_to_file(task_id: str, note):
     os.makedirs(NOTE_OUTPUT_DIR, exist_ok=True)
-    with open(os.path.join(NOTE_OUTPUT_DIR, f"{task_id}.json"), "w", encoding="utf-8") as f:
-        json.dump(asdict(note), f, ensure_ascii=False, indent=2)
+    with open(os.path.join(NOTE_OUTPUT_DIR, f"{task_id}.json"), "wb") as f:
+        # orjson 原生序列化 dataclass，省掉 asdict 的整棵深拷贝
+        f.write(orjson.dumps(note, option=orjson.OPT_SERIALIZE_DATACLASS | orjson.OPT_INDENT_2, default=str))
 
 
 def run_note_task(task_id: str, video_url: str, platform: str, quality: DownloadQuality,
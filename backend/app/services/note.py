@@ -1,16 +1,17 @@
-import json
 import logging
 import os
 import re
-from dataclasses import asdict
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Optional, Tuple, Union
 
+import orjson
 from pydantic import HttpUrl
 from dotenv import load_dotenv
 
 from app.downloaders.base import Downloader
-from app.db.video_task_dao import delete_task_by_video, insert_video_task
+from app.db.video_task_dao import delete_task_by_video, insert_video_task_async
 from app.enmus.exception import NoteErrorEnum, ProviderErrorEnum
 from app.enmus.task_status_enums import TaskStatus
 from app.enmus.note_enums import DownloadQuality
@@ -53,6 +54,60 @@ else:
 NOTE_OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
 os.makedirs(IMAGE_OUTPUT_DIR, exist_ok=True)
 
+# 截图标记正则：模块级预编译，避免每次调用都重新编译
+_SCREENSHOT_RE = re.compile(r"(?:\*Screenshot-(\d{2}):(\d{2})|Screenshot-\[(\d{2}):(\d{2})\])")
+
+
+class AsyncCacheWriter:
+    """
+    后台线程缓存写入器：submit_write 立即返回，磁盘落盘与下一阶段的
+    转写 / GPT 工作重叠。写入走 .tmp + os.replace，读方永远看到完整文件。
+
+    挂起列表按提交线程隔离（一个任务的 generate 全程跑在同一个线程里），
+    并发任务互相 drain 不会清掉 / 等错别人的写入。
+    """
+
+    def __init__(self):
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="cache-writer")
+        self._local = threading.local()
+
+    def _pending(self) -> list:
+        if not hasattr(self._local, "pending"):
+            self._local.pending = []
+        return self._local.pending
+
+    def submit_write(self, path: Path, data: bytes):
+        self._pending().append(self._executor.submit(self._write, path, data))
+
+    @staticmethod
+    def _write(path: Path, data: bytes):
+        tmp_path = path.with_name(path.name + ".tmp")
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
+
+    def drain(self):
+        """等待当前线程提交的写入落盘（任务收尾 / CLI 退出前调用）"""
+        pending = self._pending()
+        while pending:
+            future = pending.pop()
+            try:
+                future.result()
+            except Exception:
+                logger.exception("缓存写入失败")
+
+
+_cache_writer = AsyncCacheWriter()
+
+# GPT 客户端缓存：与 transcriber_provider._transcribers 同样的单例思路，
+# 同一 (model_name, provider_id) 不再重复查库 / 重建客户端
+_gpt_cache: dict = {}
+
+
+def invalidate_gpt_cache(provider_id: str):
+    """Provider 配置变更 / 删除后调用，丢弃用旧 api_key、base_url 构建的客户端"""
+    for key in [k for k in _gpt_cache if k[1] == provider_id]:
+        _gpt_cache.pop(key, None)
+
 
 class NoteGenerator:
     """
@@ -162,6 +217,10 @@ class NoteGenerator:
             logger.exception("NoteGenerator 失败")
             return None
 
+        finally:
+            # 确保返回前所有缓存文件已落盘（CLI 模式返回后进程即退出）
+            _cache_writer.drain()
+
     # ---------------- 私有方法 ----------------
 
     def _update_status(self, *args, **kwargs):
@@ -178,7 +237,7 @@ class NoteGenerator:
         """
         if IS_CLI_MODE:
             return
-        insert_video_task(video_id=video_id, platform=platform, task_id=task_id)
+        insert_video_task_async(video_id=video_id, platform=platform, task_id=task_id)
 
     def _init_transcriber(self) -> Transcriber:
         if self.transcriber_type not in _transcribers:
@@ -186,6 +245,10 @@ class NoteGenerator:
         return get_transcriber(transcriber_type=self.transcriber_type)
 
     def _get_gpt(self, model_name: str, provider_id: str) -> GPT:
+        cache_key = (model_name, provider_id)
+        if cache_key in _gpt_cache:
+            return _gpt_cache[cache_key]
+
         provider = ProviderService.get_provider_by_id(provider_id)
         if not provider:
             raise ProviderError(
@@ -199,7 +262,9 @@ class NoteGenerator:
             provider=provider["type"],
             name=provider["name"],
         )
-        return GPTFactory().from_config(config)
+        gpt = GPTFactory().from_config(config)
+        _gpt_cache[cache_key] = gpt
+        return gpt
 
     def _get_downloader(self, platform: str) -> Downloader:
         downloader_cls = SUPPORT_PLATFORM_MAP.get(platform)
@@ -225,7 +290,7 @@ class NoteGenerator:
     ) -> AudioDownloadResult:
 
         if audio_cache_file.exists():
-            data = json.loads(audio_cache_file.read_text(encoding="utf-8"))
+            data = orjson.loads(audio_cache_file.read_bytes())
             return AudioDownloadResult(**data)
 
         need_video = screenshot or video_understanding
@@ -245,9 +310,9 @@ class NoteGenerator:
             output_dir=output_path,
             need_video=need_video,
         )
-        audio_cache_file.write_text(
-            json.dumps(asdict(audio), ensure_ascii=False, indent=2),
-            encoding="utf-8",
+        _cache_writer.submit_write(
+            audio_cache_file,
+            orjson.dumps(audio, option=orjson.OPT_SERIALIZE_DATACLASS, default=str),
         )
         return audio
 
@@ -258,7 +323,7 @@ class NoteGenerator:
     ) -> TranscriptResult:
 
         if transcript_cache_file.exists():
-            data = json.loads(transcript_cache_file.read_text(encoding="utf-8"))
+            data = orjson.loads(transcript_cache_file.read_bytes())
             segments = [TranscriptSegment(**seg) for seg in data.get("segments", [])]
             return TranscriptResult(
                 language=data["language"],
@@ -266,10 +331,30 @@ class NoteGenerator:
                 segments=segments,
             )
 
-        transcript = self.transcriber.transcript(file_path=audio_file)
-        transcript_cache_file.write_text(
-            json.dumps(asdict(transcript), ensure_ascii=False, indent=2),
-            encoding="utf-8",
+        transcript_stream = getattr(self.transcriber, "transcript_stream", None)
+        if transcript_stream is None:
+            transcript = self.transcriber.transcript(file_path=audio_file)
+        else:
+            # 流式转写：每出一段就追加写入 .part 文件，
+            # 中途崩溃也能保留已转写的段落，内存里只保留段落对象本身
+            language, segment_iter = transcript_stream(file_path=audio_file)
+            part_file = transcript_cache_file.with_name(transcript_cache_file.name + ".part")
+            segments = []
+            with part_file.open("wb") as f:
+                for seg in segment_iter:
+                    segments.append(seg)
+                    f.write(orjson.dumps(seg, option=orjson.OPT_SERIALIZE_DATACLASS))
+                    f.write(b"\n")
+            transcript = TranscriptResult(
+                language=language,
+                full_text=" ".join(seg.text for seg in segments),
+                segments=segments,
+            )
+            part_file.unlink(missing_ok=True)
+
+        _cache_writer.submit_write(
+            transcript_cache_file,
+            orjson.dumps(transcript, option=orjson.OPT_SERIALIZE_DATACLASS, default=str),
         )
         return transcript
 
@@ -302,7 +387,7 @@ class NoteGenerator:
             extras=extras,
         )
         markdown = gpt.summarize(source)
-        markdown_cache_file.write_text(markdown, encoding="utf-8")
+        _cache_writer.submit_write(markdown_cache_file, markdown.encode("utf-8"))
         return markdown
 
     def _post_process_markdown(
@@ -322,20 +407,31 @@ class NoteGenerator:
 
     def _insert_screenshots(self, markdown: str, video_path: Path) -> str:
         matches = self._extract_screenshot_timestamps(markdown)
-        for idx, (marker, ts) in enumerate(matches):
-            img_path = generate_screenshot(
-                str(video_path), str(IMAGE_OUTPUT_DIR), ts, idx
-            )
-            filename = Path(img_path).name
-            img_url = f"{IMAGE_BASE_URL.rstrip('/')}/{filename}"
-            markdown = markdown.replace(marker, f"![]({img_url})", 1)
-        return markdown
+        if not matches:
+            return markdown
+
+        # 每张截图都是一次独立的 ffmpeg 进程调用，并发跑满 IO / 多核；
+        # map 保证返回顺序与标记顺序一致
+        def _capture(args):
+            idx, (marker, ts) = args
+            return generate_screenshot(str(video_path), str(IMAGE_OUTPUT_DIR), ts, idx)
+
+        with ThreadPoolExecutor(max_workers=min(4, len(matches))) as pool:
+            img_paths = list(pool.map(_capture, enumerate(matches)))
+
+        img_urls = [
+            f"{IMAGE_BASE_URL.rstrip('/')}/{Path(img_path).name}"
+            for img_path in img_paths
+        ]
+
+        # 单趟替换：逐个 str.replace 每次都要重建整篇 markdown，O(k·n) → O(n)
+        url_iter = iter(img_urls)
+        return _SCREENSHOT_RE.sub(lambda m: f"![]({next(url_iter)})", markdown)
 
     @staticmethod
     def _extract_screenshot_timestamps(markdown: str) -> List[Tuple[str, int]]:
-        pattern = r"(?:\*Screenshot-(\d{2}):(\d{2})|Screenshot-\[(\d{2}):(\d{2})\])"
         results = []
-        for match in re.finditer(pattern, markdown):
+        for match in _SCREENSHOT_RE.finditer(markdown):
             mm = match.group(1) or match.group(3)
             ss = match.group(2) or match.group(4)
             results.append((match.group(0), int(mm) * 60 + int(ss)))
@@ -123,6 +123,7 @@ class ProviderService:
             filtered_data = {k: v for k, v in data.items() if v is not None and k != 'id'}
             print('更新模型供应商',filtered_data)
             update_provider(id, **filtered_data)
+            ProviderService._invalidate_gpt_cache(id)
             return id
 
         except Exception as e:
@@ -131,4 +132,12 @@ class ProviderService:
 
     @staticmethod
     def delete_provider(id: str):
-        return delete_provider(id)
+        result = delete_provider(id)
+        ProviderService._invalidate_gpt_cache(id)
+        return result
+
+    @staticmethod
+    def _invalidate_gpt_cache(id: str):
+        # 局部导入，避免与 note.py 的循环依赖
+        from app.services.note import invalidate_gpt_cache
+        invalidate_gpt_cache(id)
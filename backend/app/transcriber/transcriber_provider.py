@@ -2,20 +2,12 @@ import os
 import platform
 from enum import Enum
 
-from app.transcriber.groq import GroqTranscriber
-
-# 👇👇👇 加上这层防弹衣 👇👇👇
-try:
-    from app.transcriber.whisper import WhisperTranscriber
-    print("SUCCESS: Local Whisper loaded successfully!")
-except ImportError as e:
-    print(f"ERROR: Local Whisper failed to load: {e}")
-    WhisperTranscriber = None
-
-from app.transcriber.bcut import BcutTranscriber
-from app.transcriber.kuaishou import KuaishouTranscriber
 from app.utils.logger import get_logger
 
+# ⚠️ 各转写器模块在对应的 get_xxx_transcriber 里按需导入：
+# whisper 一条链会拖进 faster_whisper / ctranslate2 / modelscope，
+# CLI 冷启动和只用 bcut/kuaishou 的部署不应该为它买单
+
 logger = get_logger(__name__)
 
 class TranscriberType(str, Enum):
@@ -25,15 +17,10 @@ class TranscriberType(str, Enum):
     KUAISHOU = "kuaishou"
     GROQ = "groq"
 
-# 仅在 Apple 平台启用 MLX Whisper
-MLX_WHISPER_AVAILABLE = False
-if platform.system() == "Darwin" and os.environ.get("TRANSCRIBER_TYPE") == "mlx-whisper":
-    try:
-        from app.transcriber.mlx_whisper_transcriber import MLXWhisperTranscriber
-        MLX_WHISPER_AVAILABLE = True
-        logger.info("MLX Whisper 可用，已导入")
-    except ImportError:
-        logger.warning("MLX Whisper 导入失败，可能未安装或平台不支持")
+# 仅在 Apple 平台启用 MLX Whisper（惰性导入，这里只做平台判定）
+MLX_WHISPER_AVAILABLE = (
+    platform.system() == "Darwin" and os.environ.get("TRANSCRIBER_TYPE") == "mlx-whisper"
+)
 
 logger.info('初始化转录服务提供器')
 
@@ -60,21 +47,32 @@ def _init_transcriber(key: TranscriberType, cls, *args, **kwargs):
 
 # 各类型获取方法
 def get_groq_transcriber():
+    from app.transcriber.groq import GroqTranscriber
     return _init_transcriber(TranscriberType.GROQ, GroqTranscriber)
 
-def get_whisper_transcriber(model_size="base", device="cuda"):
-    return _init_transcriber(TranscriberType.FAST_WHISPER, WhisperTranscriber, model_size=model_size, device=device)
+def get_whisper_transcriber(model_size="base", device="cuda", compute_type=None):
+    from app.transcriber.whisper import WhisperTranscriber
+    return _init_transcriber(
+        TranscriberType.FAST_WHISPER,
+        WhisperTranscriber,
+        model_size=model_size,
+        device=device,
+        compute_type=compute_type,
+    )
 
 def get_bcut_transcriber():
+    from app.transcriber.bcut import BcutTranscriber
     return _init_transcriber(TranscriberType.BCUT, BcutTranscriber)
 
 def get_kuaishou_transcriber():
+    from app.transcriber.kuaishou import KuaishouTranscriber
     return _init_transcriber(TranscriberType.KUAISHOU, KuaishouTranscriber)
 
 def get_mlx_whisper_transcriber(model_size="base"):
     if not MLX_WHISPER_AVAILABLE:
         logger.warning("MLX Whisper 不可用，请确保在 Apple 平台且已安装 mlx_whisper")
         raise ImportError("MLX Whisper 不可用")
+    from app.transcriber.mlx_whisper_transcriber import MLXWhisperTranscriber
     return _init_transcriber(TranscriberType.MLX_WHISPER, MLXWhisperTranscriber, model_size=model_size)
 
 # 通用入口
@@ -99,15 +97,20 @@ def get_transcriber(transcriber_type="fast-whisper", model_size="base", device="
         transcriber_enum = TranscriberType.FAST_WHISPER
 
     whisper_model_size = os.environ.get("WHISPER_MODEL_SIZE", model_size)
+    # int8 / int8_float16 / float16，控制 CTranslate2 的量化计算精度
+    whisper_compute_type = os.environ.get("WHISPER_COMPUTE_TYPE")
 
     if transcriber_enum == TranscriberType.FAST_WHISPER:
-        return get_whisper_transcriber(whisper_model_size, device=device)
+        return get_whisper_transcriber(whisper_model_size, device=device, compute_type=whisper_compute_type)
 
     elif transcriber_enum == TranscriberType.MLX_WHISPER:
-        if not MLX_WHISPER_AVAILABLE:
-            logger.warning("MLX Whisper 不可用，回退到 fast-whisper")
-            return get_whisper_transcriber(whisper_model_size, device=device)
-        return get_mlx_whisper_transcriber(whisper_model_size)
+        if MLX_WHISPER_AVAILABLE:
+            try:
+                return get_mlx_whisper_transcriber(whisper_model_size)
+            except ImportError:
+                logger.warning("MLX Whisper 导入失败，可能未安装或平台不支持")
+        logger.warning("MLX Whisper 不可用，回退到 fast-whisper")
+        return get_whisper_transcriber(whisper_model_size, device=device, compute_type=whisper_compute_type)
 
     elif transcriber_enum == TranscriberType.BCUT:
         return get_bcut_transcriber()
@@ -120,4 +123,4 @@ def get_transcriber(transcriber_type="fast-whisper", model_size="base", device="
 
     # fallback
     logger.warning(f'未识别转录器类型 "{transcriber_type}"，使用 fast-whisper 作为默认')
-    return get_whisper_transcriber(whisper_model_size, device=device)
+    return get_whisper_transcriber(whisper_model_size, device=device, compute_type=whisper_compute_type)
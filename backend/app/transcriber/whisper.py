@@ -1,4 +1,4 @@
-from faster_whisper import WhisperModel
+from faster_whisper import WhisperModel, BatchedInferencePipeline
 
 from app.decorators.timeit import timeit
 from app.models.transcriber_model import TranscriptSegment, TranscriptResult
@@ -8,6 +8,7 @@ from app.utils.logger import get_logger
 from app.utils.path_helper import get_model_dir
 
 from events import transcription_finished
+from ffmpeg_helper import decode_audio_pcm
 from pathlib import Path
 import os
 from tqdm import tqdm
@@ -37,7 +38,8 @@ class WhisperTranscriber(Transcriber):
             model_size: str = "base",
             device: str = 'cpu',
             compute_type: str = None,
-            cpu_threads: int = 1,
+            cpu_threads: int = None,
+            batch_size: int = None,
     ):
         if device == 'cpu' or device is None:
             self.device = 'cpu'
@@ -47,6 +49,8 @@ class WhisperTranscriber(Transcriber):
                 print('没有 cuda 使用 cpu进行计算')
 
         self.compute_type = compute_type or ("float16" if self.device == "cuda" else "int8")
+        # CPU 上吃满所有核心，CTranslate2 的 int8 GEMM 才能跑满 VNNI
+        self.cpu_threads = cpu_threads or (os.cpu_count() or 1)
 
         model_dir = get_model_dir("whisper")
         model_path = os.path.join(model_dir, f"whisper-{model_size}")
@@ -64,8 +68,15 @@ class WhisperTranscriber(Transcriber):
             model_size_or_path=model_path,
             device=self.device,
             compute_type=self.compute_type,
+            cpu_threads=self.cpu_threads,
             download_root=model_dir
         )
+
+        # 批量推理：把长音频切成 30s 窗口后按 batch 维度一次喂给 encoder，
+        # 长视频（> 1 个窗口）时 GPU 利用率接近线性提升
+        self.batch_size = batch_size if batch_size is not None \
+            else int(os.environ.get("WHISPER_BATCH_SIZE", "8"))
+        self.batched_model = BatchedInferencePipeline(model=self.model) if self.batch_size > 1 else None
     @staticmethod
     def is_torch_installed() -> bool:
         try:
@@ -90,29 +101,48 @@ class WhisperTranscriber(Transcriber):
         except ImportError:
             return False
 
-    @timeit
-    def transcript(self, file_path: str) -> TranscriptResult:
+    def _transcribe_raw(self, file_path: str):
+        # 先用 ffmpeg 解码出单份 PCM 缓冲区，模型端不再重复开文件解码
         try:
-
-            segments_raw, info = self.model.transcribe(file_path)
-
-            segments = []
-            full_text = ""
-
+            audio = decode_audio_pcm(file_path)
+        except Exception as e:
+            logger.warning(f"ffmpeg 预解码失败，回退为文件路径输入: {e}")
+            audio = file_path
+
+        if self.batched_model is not None:
+            return self.batched_model.transcribe(audio, batch_size=self.batch_size)
+        return self.model.transcribe(audio)
+
+    def transcript_stream(self, file_path: str):
+        """
+        惰性转写：返回 (language, 段落生成器)。
+        faster-whisper 本身按段 yield，这里不把全部段落攒在内存里，
+        调用方可以边转写边增量落盘。
+        """
+        segments_raw, info = self._transcribe_raw(file_path)
+
+        def _segments():
             for seg in segments_raw:
-                text = seg.text.strip()
-                full_text += text + " "
-                segments.append(TranscriptSegment(
+                yield TranscriptSegment(
                     start=seg.start,
                     end=seg.end,
-                    text=text
-                ))
+                    text=seg.text.strip()
+                )
+
+        return info.language, _segments()
+
+    @timeit
+    def transcript(self, file_path: str) -> TranscriptResult:
+        try:
+            language, segment_iter = self.transcript_stream(file_path)
+
+            segments = list(segment_iter)
+            full_text = " ".join(seg.text for seg in segments)
 
             result= TranscriptResult(
-                language=info.language,
-                full_text=full_text.strip(),
+                language=language,
+                full_text=full_text,
                 segments=segments,
-                raw=info
             )
             # self.on_finish(file_path, result)
             return result
@@ -50,13 +50,24 @@ class VideoReader:
             duration = float(ffmpeg.probe(self.video_path)["format"]["duration"])
             timestamps = [i for i in range(0, int(duration), self.frame_interval)][:max_frames]
 
+            # 单个 ffmpeg 进程 + fps 滤镜一次抽完全部帧：视频只解码一遍，
+            # 不再为每个时间戳起一个进程从头 seek
+            tmp_pattern = os.path.join(self.frame_dir, "frame_tmp_%06d.jpg")
+            cmd = ["ffmpeg", "-i", self.video_path,
+                   "-vf", f"fps=1/{self.frame_interval}",
+                   "-frames:v", str(len(timestamps)),
+                   "-q:v", "2", "-y", tmp_pattern,
+                   "-hide_banner", "-loglevel", "error"]
+            subprocess.run(cmd, check=True)
+
+            # fps=1/N 的第 i 帧对应时间戳 (i-1)*N，重命名为带时间标签的文件名
             image_paths = []
-            for ts in timestamps:
-                time_label = self.format_time(ts)
-                output_path = os.path.join(self.frame_dir, f"frame_{time_label}.jpg")
-                cmd = ["ffmpeg", "-ss", str(ts), "-i", self.video_path, "-frames:v", "1", "-q:v", "2", "-y", output_path,
-                       "-hide_banner", "-loglevel", "error"]
-                subprocess.run(cmd, check=True)
+            for idx, ts in enumerate(timestamps, start=1):
+                tmp_path = tmp_pattern % idx
+                if not os.path.exists(tmp_path):
+                    break
+                output_path = os.path.join(self.frame_dir, f"frame_{self.format_time(ts)}.jpg")
+                os.replace(tmp_path, output_path)
                 image_paths.append(output_path)
             return image_paths
         except Exception as e:
@@ -24,6 +24,22 @@ def check_ffmpeg_exists() -> bool:
         return False
 
 
+def decode_audio_pcm(file_path: str, sample_rate: int = 16000):
+    """
+    用 ffmpeg 一次性解码为 16 kHz 单声道 float32 PCM，返回 numpy 数组。
+    下游（faster-whisper）直接消费该缓冲区，不再各自重新解码文件。
+    """
+    import numpy as np
+
+    cmd = [
+        "ffmpeg", "-nostdin", "-i", file_path,
+        "-f", "f32le", "-ac", "1", "-ar", str(sample_rate),
+        "-hide_banner", "-loglevel", "error", "pipe:1",
+    ]
+    proc = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=True)
+    return np.frombuffer(proc.stdout, dtype=np.float32)
+
+
 def ensure_ffmpeg_or_raise():
     """
     校验 ffmpeg 是否可用，否则抛出异常并提示安装方式。
@@ -1,8 +1,11 @@
 import sys
 import os
-import json
+import hashlib
 import logging
 import re
+
+import orjson
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
 
 import uvicorn
@@ -44,11 +47,24 @@ if IS_CLI_MODE:
 # =============================
 # 工具函数
 # =============================
+_BVID_RE = re.compile(r"(BV[0-9A-Za-z]{10})")
+
+
+def _url_fingerprint(url: str) -> str:
+    """URL 的确定性 64 位指纹。内置 hash() 受 PYTHONHASHSEED 影响，
+    跨进程不稳定，会导致同一 URL 每次落到不同目录"""
+    digest = hashlib.blake2b(url.encode("utf-8"), digest_size=8).digest()
+    return str(int.from_bytes(digest, "big"))
+
+
 def extract_bvid(url: str) -> str:
     """从 URL 提取 BV 号，作为稳定主键"""
-    match = re.search(r"(BV[0-9A-Za-z]{10})", url)
+    # 快速路径：连 "BV" 子串都没有就不必走正则
+    if "BV" not in url:
+        return f"UNKNOWN_{_url_fingerprint(url)}"
+    match = _BVID_RE.search(url)
     if not match:
-        return f"UNKNOWN_{abs(hash(url))}"
+        return f"UNKNOWN_{_url_fingerprint(url)}"
     return match.group(1)
 
 
@@ -65,8 +81,11 @@ def save_cli_result(bvid: str, payload: dict):
     tmp_path = final_path + ".tmp"
 
     try:
-        with open(tmp_path, "w", encoding="utf-8") as f:
-            json.dump(payload, f, ensure_ascii=False, indent=2)
+        with open(tmp_path, "wb") as f:
+            f.write(orjson.dumps(payload, option=orjson.OPT_INDENT_2))
+            # rename 前先把数据刷到盘上，掉电也不会出现空的 result.json
+            f.flush()
+            os.fsync(f.fileno())
 
         # ✅ 原子替换，Java 永远读到完整文件
         os.replace(tmp_path, final_path)
@@ -118,59 +137,11 @@ if __name__ == "__main__":
     if IS_CLI_MODE:
         ensure_ffmpeg_or_raise()
 
-        video_url = sys.argv[1]
-        bvid = extract_bvid(video_url)
-        task_id = f"task_{bvid}"
-
-        logger.info(f"[CLI] 启动采集 | BVID={bvid}")
-        print(f"STATUS=START BVID={bvid}")
-
-        try:
-            generator = NoteGenerator()
-
-            note_result = generator.generate(
-                video_url=video_url,
-                platform="bilibili",
-                quality=DownloadQuality.medium,
-                task_id=task_id,
-                model_name=None,      # 🔒 关闭 GPT
-                provider_id=None,
-                summary=False,
-                transcribe=True,
-            )
-
-            if not note_result or not note_result.transcript:
-                raise RuntimeError("转写失败或结果为空")
-
-            # 🔥 这里的改动：增加了 fullText 字段，双重保险
-            transcript_obj = {
-                "full_text": note_result.transcript.full_text,
-                "fullText": note_result.transcript.full_text,  # 👈 给 Java 的 Jackson/FastJSON 兜底
-                "segments": [
-                    {"start": s.start, "end": s.end, "text": s.text}
-                    for s in note_result.transcript.segments
-                ],
-            }
-
-            result_payload = {
-                "bvid": bvid,
-                "platform": "bilibili",
-                "url": video_url,
-                "engine": "billnote-whisper-pure",
-                "stage": "transcript",
-                "status": "SUCCESS",
-                "transcript": transcript_obj,
-                "summary": "",  # Java 侧安全占位
-                "meta": note_result.audio_meta.raw_info if note_result.audio_meta else {},
-            }
-
-            save_cli_result(bvid, result_payload)
-            print("STATUS=SUCCESS")
-            sys.exit(0)
-
-        except Exception as e:
-            logger.exception("[CLI] 执行失败")
+        # 支持一次传入多个 URL：模型只加载一次，URL 之间复用同一个进程
+        video_urls = sys.argv[1:]
 
+        def save_cli_failure(video_url: str, e: Exception):
+            bvid = extract_bvid(video_url)
             error_payload = {
                 "bvid": bvid,
                 "platform": "bilibili",
@@ -180,11 +151,82 @@ if __name__ == "__main__":
                 "error": str(e),
                 "summary": "",
             }
-
             save_cli_result(bvid, error_payload)
             print(f"STATUS=FAILED ERROR={e}")
+
+        # 初始化失败（模型下载失败、TRANSCRIBER_TYPE 配错、缺 CUDA 库等）
+        # 也要给每个 URL 落一份 FAILED result.json，Java 侧才能读到明确结果
+        try:
+            generator = NoteGenerator()
+        except Exception as e:
+            logger.exception("[CLI] 初始化失败")
+            for video_url in video_urls:
+                save_cli_failure(video_url, e)
             sys.exit(1)
 
+        def run_cli_task(video_url: str) -> bool:
+            bvid = extract_bvid(video_url)
+            task_id = f"task_{bvid}"
+
+            logger.info(f"[CLI] 启动采集 | BVID={bvid}")
+            print(f"STATUS=START BVID={bvid}")
+
+            try:
+                note_result = generator.generate(
+                    video_url=video_url,
+                    platform="bilibili",
+                    quality=DownloadQuality.medium,
+                    task_id=task_id,
+                    model_name=None,      # 🔒 关闭 GPT
+                    provider_id=None,
+                    summary=False,
+                    transcribe=True,
+                )
+
+                if not note_result or not note_result.transcript:
+                    raise RuntimeError("转写失败或结果为空")
+
+                # 🔥 这里的改动：增加了 fullText 字段，双重保险
+                transcript_obj = {
+                    "full_text": note_result.transcript.full_text,
+                    "fullText": note_result.transcript.full_text,  # 👈 给 Java 的 Jackson/FastJSON 兜底
+                    "segments": [
+                        {"start": s.start, "end": s.end, "text": s.text}
+                        for s in note_result.transcript.segments
+                    ],
+                }
+
+                result_payload = {
+                    "bvid": bvid,
+                    "platform": "bilibili",
+                    "url": video_url,
+                    "engine": "billnote-whisper-pure",
+                    "stage": "transcript",
+                    "status": "SUCCESS",
+                    "transcript": transcript_obj,
+                    "summary": "",  # Java 侧安全占位
+                    "meta": note_result.audio_meta.raw_info if note_result.audio_meta else {},
+                }
+
+                save_cli_result(bvid, result_payload)
+                print("STATUS=SUCCESS")
+                return True
+
+            except Exception as e:
+                logger.exception("[CLI] 执行失败")
+                save_cli_failure(video_url, e)
+                return False
+
+        # CLI_WORKERS > 1 时并发跑多个 URL（下载 IO 与转写计算互相重叠）
+        max_workers = min(int(os.getenv("CLI_WORKERS", "1") or 1), len(video_urls)) or 1
+        if max_workers > 1:
+            with ThreadPoolExecutor(max_workers=max_workers) as pool:
+                results = list(pool.map(run_cli_task, video_urls))
+        else:
+            results = [run_cli_task(url) for url in video_urls]
+
+        sys.exit(0 if all(results) else 1)
+
     else:
         host = os.getenv("BACKEND_HOST", "0.0.0.0")
         port = int(os.getenv("BACKEND_PORT", 8483))